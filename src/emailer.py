@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import os
 import smtplib
 from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +15,19 @@ logger = logging.getLogger(__name__)
 
 TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "templates" / "email_template.html"
 
+_template: Template | None = None
+
+# Logged-in SMTP connections, reused across sends in the same process
+_smtp_pool: dict[tuple[str, int, str], smtplib.SMTP] = {}
+
+
+def _get_template() -> Template:
+    """Compile the email template once; set EMAIL_TEMPLATE_NOCACHE to reload it on every send."""
+    global _template
+    if _template is None or os.getenv("EMAIL_TEMPLATE_NOCACHE"):
+        _template = Template(TEMPLATE_PATH.read_text())
+    return _template
+
 
 def _render_html(
     stories: list[dict[str, Any]],
@@ -22,9 +35,7 @@ def _render_html(
     source_count: int,
     tweet_count: int,
 ) -> str:
-    template_text = TEMPLATE_PATH.read_text()
-    template = Template(template_text)
-    return template.render(
+    return _get_template().render(
         stories=stories,
         date=date_str,
         source_count=source_count,
@@ -32,6 +43,45 @@ def _render_html(
     )
 
 
+def _get_smtp(host: str, port: int, sender: str, password: str) -> smtplib.SMTP:
+    """Return a live, authenticated connection, reconnecting if the pooled one dropped."""
+    key = (host, port, sender)
+    server = _smtp_pool.get(key)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except smtplib.SMTPException:
+            pass
+        _drop_smtp(key)
+
+    server = smtplib.SMTP(host, port)
+    try:
+        server.starttls()
+        server.login(sender, password)
+    except Exception:
+        server.close()
+        raise
+    _smtp_pool[key] = server
+    return server
+
+
+def _drop_smtp(key: tuple[str, int, str]) -> None:
+    server = _smtp_pool.pop(key, None)
+    if server is None:
+        return
+    try:
+        server.quit()
+    except smtplib.SMTPException:
+        server.close()
+
+
+@atexit.register
+def _close_smtp_pool() -> None:
+    for key in list(_smtp_pool):
+        _drop_smtp(key)
+
+
 def _render_plain_text(stories: list[dict[str, Any]]) -> str:
     lines: list[str] = ["AI DAILY BRIEF", "=" * 40, ""]
     for i, story in enumerate(stories, 1):
@@ -71,7 +121,7 @@ def send_brief(
     date_str = datetime.now(timezone.utc).strftime("%A, %B %d, %Y")
     subject = f"{subject_prefix} — {date_str}"
 
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = sender
     msg["To"] = ", ".join(recipients)
@@ -79,13 +129,15 @@ def send_brief(
     plain_text = _render_plain_text(stories)
     html = _render_html(stories, date_str, source_count, tweet_count)
 
-    msg.attach(MIMEText(plain_text, "plain"))
-    msg.attach(MIMEText(html, "html"))
+    msg.set_content(plain_text)
+    msg.add_alternative(html, subtype="html")
 
     logger.info("Sending email to %s via %s:%d", ", ".join(recipients), smtp_host, smtp_port)
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.starttls()
-        server.login(sender, password)
-        server.sendmail(sender, recipients, msg.as_string())
+    server = _get_smtp(smtp_host, smtp_port, sender, password)
+    try:
+        server.send_message(msg, from_addr=sender, to_addrs=recipients)
+    except smtplib.SMTPServerDisconnected:
+        _drop_smtp((smtp_host, smtp_port, sender))
+        raise
 
     logger.info("Email sent successfully")
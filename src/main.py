@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from .emailer import send_brief
 from .scraper import Tweet, create_scraper, parse_config
 from .summarizer import prefilter_tweets, summarize_tweets
@@ -17,9 +24,40 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT_DIR / "config.md"
 SETTINGS_PATH = ROOT_DIR / "settings.yaml"
 
+_PARSE_CACHE_MAX = 100
+# (path, parser name) -> (mtime, size, parsed value); parsed values are not mutated by callers
+_PARSE_CACHE: OrderedDict[tuple[str, str], tuple[float, int, Any]] = OrderedDict()
+
+T = TypeVar("T")
+
+
+def _cached_parse(path: Path, parser: Callable[[Path], T]) -> T:
+    """Return ``parser(path)``, reusing the last result while the file's mtime and size are unchanged."""
+    st = path.stat()
+    key = (str(path), parser.__qualname__)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        _PARSE_CACHE.move_to_end(key)
+        return cached[2]
+
+    value = parser(path)
+    _PARSE_CACHE[key] = (st.st_mtime, st.st_size, value)
+    _PARSE_CACHE.move_to_end(key)
+    if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+        _PARSE_CACHE.popitem(last=False)
+    return value
+
+
+def _parse_settings(path: Path) -> dict[str, Any]:
+    return yaml.load(path.read_text(), Loader=SafeLoader)
+
 
 def load_settings() -> dict[str, Any]:
-    return yaml.safe_load(SETTINGS_PATH.read_text())
+    return _cached_parse(SETTINGS_PATH, _parse_settings)
+
+
+def load_config() -> tuple[list[str], list[str], str]:
+    return _cached_parse(CONFIG_PATH, parse_config)
 
 
 async def fetch_all_tweets(
@@ -28,11 +66,18 @@ async def fetch_all_tweets(
     settings: dict[str, Any],
 ) -> list[Tweet]:
     scraper_cfg = settings.get("scraper", {})
-    delay = scraper_cfg.get("delay_between_users", 2)
     max_per_user = scraper_cfg.get("max_tweets_per_user", 50)
     search_count = scraper_cfg.get("max_tweets_per_search", 20)
-
-    scraper = create_scraper()
+    sem = asyncio.Semaphore(scraper_cfg.get("concurrency", 8))
+
+    scraper = create_scraper(
+        requests_per_second=scraper_cfg.get("requests_per_second", 1.0),
+        max_retries=scraper_cfg.get("max_retries", 3),
+        max_backoff_seconds=scraper_cfg.get("max_backoff_seconds", 30),
+        lookback_cutoff=datetime.now(timezone.utc)
+        - timedelta(hours=scraper_cfg.get("lookback_hours", 24)),
+        skip_retweets=True,
+    )
     seen_ids: set[str] = set()
     all_tweets: list[Tweet] = []
 
@@ -45,21 +90,30 @@ async def fetch_all_tweets(
                 added += 1
         return added
 
-    # 1. Scrape accounts
-    for handle in handles:
-        logger.info("Scraping @%s ...", handle)
-        tweets = await scraper.scrape_user(handle, max_tweets=max_per_user)
+    async def _scrape_one(handle: str) -> list[Tweet]:
+        async with sem:
+            logger.info("Scraping @%s ...", handle)
+            return await scraper.scrape_user(handle, max_tweets=max_per_user)
+
+    async def _search_one(query: str) -> list[Tweet]:
+        async with sem:
+            logger.info("Searching '%s' ...", query)
+            return await scraper.search_tweets(query, count=search_count)
+
+    # 1. Scrape accounts + search queries concurrently
+    user_results, search_results = await asyncio.gather(
+        asyncio.gather(*(_scrape_one(h) for h in handles)),
+        asyncio.gather(*(_search_one(q) for q in search_queries)),
+    )
+
+    # 2. Merge in config order so account tweets win over search duplicates
+    for handle, tweets in zip(handles, user_results):
         added = _add(tweets)
-        logger.info("  Got %d tweets from @%s (%d new)", len(tweets), handle, added)
-        await asyncio.sleep(delay)
+        logger.info("  Kept %d tweets from @%s (%d new)", len(tweets), handle, added)
 
-    # 2. Search by queries
-    for query in search_queries:
-        logger.info("Searching '%s' ...", query)
-        tweets = await scraper.search_tweets(query, count=search_count)
+    for query, tweets in zip(search_queries, search_results):
         added = _add(tweets)
-        logger.info("  Got %d results for '%s' (%d new)", len(tweets), query, added)
-        await asyncio.sleep(delay)
+        logger.info("  Kept %d results for '%s' (%d new)", len(tweets), query, added)
 
     await scraper.close()
     return all_tweets
@@ -72,7 +126,7 @@ async def run() -> None:
     )
 
     logger.info("Loading config and settings")
-    handles, search_queries, curation_prompt = parse_config(CONFIG_PATH)
+    handles, search_queries, curation_prompt = load_config()
     settings = load_settings()
 
     logger.info("Found %d accounts and %d search queries", len(handles), len(search_queries))
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Tweet:
     id: str
     author_handle: str
@@ -21,10 +20,10 @@ class Tweet:
     url: str = ""
     is_retweet: bool = False
     media_urls: list[str] = field(default_factory=list)
+    engagement_score: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def engagement_score(self) -> float:
-        return self.likes + self.retweets * 2 + self.replies * 0.5
+    def __post_init__(self) -> None:
+        self.engagement_score = self.likes + self.retweets * 2 + self.replies * 0.5
 
 
 class BaseScraper(ABC):
@@ -48,34 +47,39 @@ def parse_config(config_path: str | Path) -> tuple[list[str], list[str], str]:
     """Parse config.md and return (handles, search_queries, prompt text)."""
     text = Path(config_path).read_text()
 
-    accounts_section = ""
-    search_section = ""
-    prompt_section = ""
+    handles: list[str] = []
+    queries: list[str] = []
+    prompt_lines: list[str] = []
+    current: str | None = None
 
-    sections = re.split(r"^# ", text, flags=re.MULTILINE)
-    for section in sections:
-        lower = section.lower()
-        if lower.startswith("accounts"):
-            accounts_section = section
-        elif lower.startswith("search"):
-            search_section = section
-        elif lower.startswith("prompt"):
-            prompt_section = "\n".join(section.split("\n")[1:]).strip()
+    for raw in text.splitlines():
+        if raw.startswith("# "):
+            title = raw[2:].lower()
+            if title.startswith("accounts"):
+                current = "accounts"
+                handles = []
+            elif title.startswith("search"):
+                current = "search"
+                queries = []
+            elif title.startswith("prompt"):
+                current = "prompt"
+                prompt_lines = []
+            else:
+                current = None
+            continue
 
-    handles: list[str] = []
-    for line in accounts_section.splitlines():
-        line = line.strip()
-        if line.startswith("- @"):
+        if current == "prompt":
+            prompt_lines.append(raw)
+            continue
+
+        line = raw.strip()
+        if current == "accounts" and line.startswith("- @"):
             handle = line.lstrip("- @").strip()
             if handle:
                 handles.append(handle)
-
-    queries: list[str] = []
-    for line in search_section.splitlines():
-        line = line.strip()
-        if line.startswith("- "):
+        elif current == "search" and line.startswith("- "):
             query = line[2:].strip()
             if query:
                 queries.append(query)
 
-    return handles, queries, prompt_section
+    return handles, queries, "\n".join(prompt_lines).strip()
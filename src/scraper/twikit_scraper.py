@@ -3,7 +3,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import operator
 import os
+import random
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,12 +18,66 @@ logger = logging.getLogger(__name__)
 
 COOKIES_FILE = Path(__file__).resolve().parent.parent.parent / "cookies.json"
 
+_MONTHS = {
+    m: i
+    for i, m in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
+
+_COUNTS = operator.attrgetter("favorite_count", "retweet_count", "reply_count", "view_count")
+
+
+class RateLimiter:
+    """Async token bucket shared by every request a scraper makes."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self._rate = rate
+        self._burst = max(burst, 1)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` (e.g. until a rate-limit window resets)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
 
 class TwikitScraper(BaseScraper):
-    def __init__(self, cookies_json: str | None = None):
+    def __init__(
+        self,
+        cookies_json: str | None = None,
+        requests_per_second: float = 1.0,
+        max_retries: int = 3,
+        max_backoff_seconds: float = 30.0,
+        lookback_cutoff: datetime | None = None,
+        skip_retweets: bool = False,
+    ):
         self._client = twikit.Client("en-US")
         self._cookies_json = cookies_json or os.getenv("TWITTER_COOKIES", "")
         self._authenticated = False
+        self._limiter = RateLimiter(requests_per_second)
+        self._max_retries = max(max_retries, 0)
+        self._max_backoff = max_backoff_seconds
+        self._lookback_cutoff = lookback_cutoff
+        self._skip_retweets = skip_retweets
 
     async def _ensure_auth(self) -> None:
         if self._authenticated:
@@ -51,94 +108,127 @@ class TwikitScraper(BaseScraper):
             "  3. Place a cookies.json file in the project root"
         )
 
+    async def _call(self, fn, *args, **kwargs):
+        """Run a twikit request through the rate limiter, retrying on 429s."""
+        for attempt in range(self._max_retries + 1):
+            await self._limiter.acquire()
+            try:
+                return await fn(*args, **kwargs)
+            except twikit.errors.TooManyRequests as e:
+                if attempt == self._max_retries:
+                    raise
+                wait = self._seconds_until_reset(getattr(e, "headers", None))
+                if wait is not None and wait > self._max_backoff:
+                    # Window resets too far out; drop this batch rather than stall the run
+                    raise
+                delay = min(2**attempt + random.random(), self._max_backoff)
+                if wait is not None:
+                    self._limiter.pause(wait)
+                    delay = max(delay, wait)
+                logger.info("Rate limited, retrying in %.1fs (attempt %d)", delay, attempt + 1)
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _seconds_until_reset(headers) -> float | None:
+        if not headers:
+            return None
+        if headers.get("x-rate-limit-remaining") not in (None, "0"):
+            return None
+        reset = headers.get("x-rate-limit-reset")
+        if reset is None:
+            return None
+        try:
+            return max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            return None
+
     async def scrape_user(self, handle: str, max_tweets: int = 50) -> list[Tweet]:
         await self._ensure_auth()
-        tweets: list[Tweet] = []
         try:
-            user = await self._client.get_user_by_screen_name(handle)
+            user = await self._call(self._client.get_user_by_screen_name, handle)
             if user is None:
                 logger.warning("User @%s not found", handle)
-                return tweets
+                return []
 
-            user_tweets = await self._client.get_user_tweets(
-                user.id, tweet_type="Tweets", count=max_tweets
+            user_tweets = await self._call(
+                self._client.get_user_tweets, user.id, tweet_type="Tweets", count=max_tweets
             )
-            for t in user_tweets:
-                created_at = self._parse_time(t.created_at)
-                is_retweet = bool(
-                    getattr(t, "retweeted_tweet", None)
-                    or (t.text and t.text.startswith("RT @"))
-                )
-                media_urls = []
-                if hasattr(t, "media") and t.media:
-                    for m in t.media:
-                        url = getattr(m, "media_url_https", None) or getattr(m, "url", None)
-                        if url:
-                            media_urls.append(url)
-
-                tweets.append(
-                    Tweet(
-                        id=t.id,
-                        author_handle=handle,
-                        author_name=getattr(user, "name", handle),
-                        text=t.text or "",
-                        created_at=created_at,
-                        likes=getattr(t, "favorite_count", 0) or 0,
-                        retweets=getattr(t, "retweet_count", 0) or 0,
-                        replies=getattr(t, "reply_count", 0) or 0,
-                        views=getattr(t, "view_count", 0) or 0,
-                        url=f"https://x.com/{handle}/status/{t.id}",
-                        is_retweet=is_retweet,
-                        media_urls=media_urls,
-                    )
-                )
+            name = getattr(user, "name", handle)
+            prefix = f"https://x.com/{handle}/status/"
+            tweets = [
+                tweet
+                for t in user_tweets
+                if (tweet := self._build_tweet(t, handle, name, prefix)) is not None
+            ]
+            logger.info(
+                "  Fetched %d tweets from @%s, %d kept after filtering",
+                len(user_tweets), handle, len(tweets),
+            )
+            return tweets
         except Exception as e:
             logger.warning("Failed to scrape @%s: %s", handle, e)
-
-        return tweets
+            return []
 
     async def search_tweets(self, query: str, count: int = 20) -> list[Tweet]:
         await self._ensure_auth()
-        tweets: list[Tweet] = []
         try:
-            results = await self._client.search_tweet(query, product="Top", count=count)
+            results = await self._call(
+                self._client.search_tweet, query, product="Top", count=count
+            )
+            tweets: list[Tweet] = []
+            prefixes: dict[str, str] = {}
+            fetched = 0
             for t in results:
-                created_at = self._parse_time(t.created_at)
-                is_retweet = bool(
-                    getattr(t, "retweeted_tweet", None)
-                    or (t.text and t.text.startswith("RT @"))
-                )
+                fetched += 1
                 user = getattr(t, "user", None)
                 handle = getattr(user, "screen_name", "unknown") if user else "unknown"
                 name = getattr(user, "name", handle) if user else handle
-
-                media_urls = []
-                if hasattr(t, "media") and t.media:
-                    for m in t.media:
-                        url = getattr(m, "media_url_https", None) or getattr(m, "url", None)
-                        if url:
-                            media_urls.append(url)
-
-                tweets.append(
-                    Tweet(
-                        id=t.id,
-                        author_handle=handle,
-                        author_name=name,
-                        text=t.text or "",
-                        created_at=created_at,
-                        likes=getattr(t, "favorite_count", 0) or 0,
-                        retweets=getattr(t, "retweet_count", 0) or 0,
-                        replies=getattr(t, "reply_count", 0) or 0,
-                        views=getattr(t, "view_count", 0) or 0,
-                        url=f"https://x.com/{handle}/status/{t.id}",
-                        is_retweet=is_retweet,
-                        media_urls=media_urls,
-                    )
-                )
+                prefix = prefixes.get(handle)
+                if prefix is None:
+                    prefix = prefixes[handle] = f"https://x.com/{handle}/status/"
+                tweet = self._build_tweet(t, handle, name, prefix)
+                if tweet is not None:
+                    tweets.append(tweet)
+            logger.info(
+                "  Fetched %d results for '%s', %d kept after filtering",
+                fetched, query, len(tweets),
+            )
+            return tweets
         except Exception as e:
             logger.warning("Failed to search '%s': %s", query, e)
+            return []
 
-        return tweets
+    def _build_tweet(self, t, handle: str, name: str, url_prefix: str) -> Tweet | None:
+        """Convert a twikit tweet, or return None if it is a skipped retweet or too old."""
+        is_retweet = (
+            getattr(t, "retweeted_tweet", None) is not None
+            or (t.text or "").startswith("RT @")
+        )
+        if is_retweet and self._skip_retweets:
+            return None
+        created_at = self._parse_time(t.created_at)
+        if self._lookback_cutoff is not None and created_at < self._lookback_cutoff:
+            return None
+
+        likes, retweets, replies, views = _COUNTS(t)
+        return Tweet(
+            id=t.id,
+            author_handle=handle,
+            author_name=name,
+            text=t.text or "",
+            created_at=created_at,
+            likes=likes or 0,
+            retweets=retweets or 0,
+            replies=replies or 0,
+            views=views or 0,
+            url=url_prefix + str(t.id),
+            is_retweet=is_retweet,
+            media_urls=[
+                url
+                for m in (getattr(t, "media", None) or ())
+                if (url := getattr(m, "media_url_https", None) or getattr(m, "url", None))
+            ],
+        )
 
     async def close(self) -> None:
         pass
@@ -147,8 +237,22 @@ class TwikitScraper(BaseScraper):
     def _parse_time(time_str: str | None) -> datetime:
         if not time_str:
             return datetime.now(timezone.utc)
+        # Twitter format: "Wed Oct 10 20:19:24 +0000 2018"; slice it directly
+        # when it's UTC, which is always the case in practice
+        if len(time_str) == 30 and time_str[20:25] == "+0000":
+            try:
+                return datetime(
+                    int(time_str[26:30]),
+                    _MONTHS[time_str[4:7]],
+                    int(time_str[8:10]),
+                    int(time_str[11:13]),
+                    int(time_str[14:16]),
+                    int(time_str[17:19]),
+                    tzinfo=timezone.utc,
+                )
+            except (KeyError, ValueError):
+                pass
         try:
-            # Twitter format: "Wed Oct 10 20:19:24 +0000 2018"
             dt = datetime.strptime(time_str, "%a %b %d %H:%M:%S %z %Y")
             return dt
         except ValueError:
@@ -1,24 +1,38 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
 import json
 import logging
+import operator
 import os
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 import anthropic
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional speedup
+    _loads = json.loads
+
 from .scraper.base import Tweet
 
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "summaries"
+
 
 def prefilter_tweets(
     tweets: list[Tweet],
     lookback_hours: int = 24,
     max_tweets: int = 200,
 ) -> list[Tweet]:
-    """Remove retweets, filter to recent, sort by engagement, take top N."""
+    """Remove retweets, filter to recent, take the top N by engagement."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
 
     filtered = [
@@ -26,20 +40,23 @@ def prefilter_tweets(
         if not t.is_retweet and t.created_at >= cutoff
     ]
 
-    filtered.sort(key=lambda t: t.engagement_score, reverse=True)
-    return filtered[:max_tweets]
+    return heapq.nlargest(max_tweets, filtered, key=operator.attrgetter("engagement_score"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_minute(minute: int) -> str:
+    """Format a UTC minute (seconds since epoch // 60) as 'YYYY-MM-DD HH:MM'."""
+    return datetime.fromtimestamp(minute * 60, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
 
 
 def _build_tweet_block(tweets: list[Tweet]) -> str:
-    lines: list[str] = []
-    for t in tweets:
-        lines.append(
-            f"[@{t.author_handle}] ({t.created_at.strftime('%Y-%m-%d %H:%M')} UTC) "
-            f"[Likes:{t.likes} RT:{t.retweets} Replies:{t.replies}]\n"
-            f"{t.text}\n"
-            f"URL: {t.url}\n"
-        )
-    return "\n---\n".join(lines)
+    return "\n---\n".join(
+        f"[@{t.author_handle}] ({_fmt_minute(int(t.created_at.timestamp()) // 60)} UTC) "
+        f"[Likes:{t.likes} RT:{t.retweets} Replies:{t.replies}]\n"
+        f"{t.text}\n"
+        f"URL: {t.url}\n"
+        for t in tweets
+    )
 
 
 def summarize_tweets(
@@ -58,8 +75,6 @@ def summarize_tweets(
     if not api_key:
         raise RuntimeError("ANTHROPIC_API_KEY environment variable is not set")
 
-    client = anthropic.Anthropic(api_key=api_key)
-
     tweet_block = _build_tweet_block(tweets)
 
     system_prompt = (
@@ -80,14 +95,32 @@ def summarize_tweets(
 
     user_message = f"Here are today's tweets:\n\n{tweet_block}"
 
-    response = client.messages.create(
+    # Opt-in cache so reruns over the same tweets skip the API call
+    cache_path: Path | None = None
+    if os.environ.get("AI_BRIEF_CACHE") == "1":
+        key = hashlib.sha256(
+            "\0".join((model, str(max_tokens), system_prompt, user_message)).encode()
+        ).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.json"
+        if cache_path.exists():
+            try:
+                cached = _loads(cache_path.read_bytes())
+            except (OSError, json.JSONDecodeError):
+                cached = None
+            if isinstance(cached, list):
+                logger.info("Using cached summary %s", cache_path.name)
+                return cached
+            logger.warning("Ignoring unreadable cached summary %s", cache_path.name)
+
+    client = anthropic.Anthropic(api_key=api_key)
+
+    with client.messages.stream(
         model=model,
         max_tokens=max_tokens,
         system=system_prompt,
         messages=[{"role": "user", "content": user_message}],
-    )
-
-    raw_text = response.content[0].text.strip()
+    ) as stream:
+        raw_text = "".join(stream.text_stream).strip()
 
     # Strip markdown fences if present
     if raw_text.startswith("```"):
@@ -97,8 +130,8 @@ def summarize_tweets(
         raw_text = raw_text.strip()
 
     try:
-        stories = json.loads(raw_text)
-    except json.JSONDecodeError:
+        stories = _loads(raw_text)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
         logger.error("Failed to parse Claude response as JSON:\n%s", raw_text)
         return []
 
@@ -106,4 +139,14 @@ def summarize_tweets(
         logger.error("Expected JSON array, got %s", type(stories))
         return []
 
+    if cache_path is not None:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(stories))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Failed to cache summary %s: %s", cache_path.name, e)
+            tmp_path.unlink(missing_ok=True)
+
     return stories